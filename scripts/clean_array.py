@@ -34,6 +34,12 @@ list
 """
 
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 只读哨兵：缺少 noteCard 时用于链式 .get()，不要修改
+_EMPTY: dict = {}
 
 
 def clean_xsec_tokens(data_array):
@@ -46,7 +52,7 @@ def clean_xsec_tokens(data_array):
     Returns:
         清洗后的数组
     """
-    if not isinstance(data_array, list):
+    if type(data_array) is not list:
         raise TypeError("输入必须是数组！")
 
     cleaned_count = 0
@@ -54,18 +60,14 @@ def clean_xsec_tokens(data_array):
     # 遍历数组中的每个元素
     for item in data_array:
         # 只处理 note 类型的对象
-        if isinstance(item, dict) and item.get('modelType') == 'note':
-            # 检查 noteCard 和 user 是否存在
-            if 'noteCard' in item and 'user' in item['noteCard']:
-                user = item['noteCard']['user']
-
-                # 如果用户对象有 xsecToken，就删除它
-                if 'xsecToken' in user:
-                    del user['xsecToken']
-                    cleaned_count += 1
-                    print(f"✓ 已删除 xsecToken (对象ID: {item.get('id', 'N/A')[:10]}...)")
-
-    print(f"\n📊 清洗完成: 共删除了 {cleaned_count} 个重复的 xsecToken")
+        if type(item) is dict and item.get('modelType') == 'note':
+            user = item.get('noteCard', _EMPTY).get('user')
+            # 如果用户对象有 xsecToken，就删除它
+            if user is not None and 'xsecToken' in user:
+                del user['xsecToken']
+                cleaned_count += 1
+
+    logger.debug("清洗完成: 共删除了 %d 个重复的 xsecToken", cleaned_count)
     return data_array
 
 
@@ -84,21 +86,19 @@ def clean_json_string(json_string):
     try:
         # 解析JSON字符串
         obj = json.loads(json_string)
-
-        # 如果是note类型，删除user.xsecToken
-        if isinstance(obj, dict) and obj.get('modelType') == 'note':
-            if 'noteCard' in obj and 'user' in obj['noteCard']:
-                user = obj['noteCard']['user']
-                if 'xsecToken' in user:
-                    del user['xsecToken']
-                    print(f"✓ 已删除字符串中的 user.xsecToken")
-
-        # 转换回JSON字符串
-        return json.dumps(obj, ensure_ascii=False)
     except json.JSONDecodeError:
-        print("⚠ 无法解析JSON字符串")
+        logger.warning("无法解析JSON字符串")
         return json_string
 
+    # 如果是note类型，删除user.xsecToken
+    if isinstance(obj, dict) and obj.get('modelType') == 'note':
+        user = obj.get('noteCard', _EMPTY).get('user')
+        if user is not None:
+            user.pop('xsecToken', None)
+
+    # 转换回JSON字符串
+    return json.dumps(obj, ensure_ascii=False)
+
 
 # ==================== 使用示例 ====================
 
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("playwright")
+
+from xhs_mcp import mcp_server  # noqa: E402
+
+
+class FakeExecutor:
+    """Holds submitted calls as running until the test finishes them, like a busy worker thread."""
+
+    def __init__(self, max_workers: int = 1, thread_name_prefix: str = "") -> None:
+        self.name = thread_name_prefix
+        self.pending: list[tuple[Future, object, dict]] = []
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        self.pending.append((future, fn, kwargs))
+        return future
+
+    def run_next(self) -> None:
+        future, fn, kwargs = self.pending.pop(0)
+        future.set_result(fn(**kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+class FakeSharedBrowser:
+    def __init__(self, max_contexts: int = 4) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(mcp_server, "ThreadPoolExecutor", FakeExecutor)
+    monkeypatch.setattr(mcp_server, "SharedBrowser", FakeSharedBrowser)
+    monkeypatch.setattr(mcp_server, "_run_with_page_sync", lambda *, shared, **_: shared)
+    monkeypatch.setattr(mcp_server, "_WORKERS", [])
+    monkeypatch.setattr(mcp_server, "_IDLE_WORKERS", None)
+    monkeypatch.setattr(mcp_server.DEFAULTS, "workers", 2)
+    return mcp_server._WORKERS
+
+
+def _call() -> asyncio.Task:
+    return asyncio.ensure_future(
+        mcp_server._run_with_page(
+            profile=None,
+            cookies_path=None,
+            chrome_bin=None,
+            debug_dir=None,
+            trace=False,
+            handler=lambda ctx, cookies: None,
+        )
+    )
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_sequential_calls_reuse_one_worker(pool):
+    async def scenario():
+        shared = []
+        for _ in range(3):
+            task = _call()
+            await _settle()
+            pool[0].executor.run_next()
+            shared.append(await task)
+        return shared
+
+    shared = asyncio.run(scenario())
+
+    assert len(pool) == 1
+    assert shared == [pool[0].shared] * 3
+
+
+def test_overlapping_calls_grow_pool_and_reuse_last_released(pool):
+    async def scenario():
+        first, second = _call(), _call()
+        await _settle()
+        assert len(pool) == 2
+        a, b = pool
+
+        b.executor.run_next()
+        await second
+        a.executor.run_next()
+        await first
+
+        # Both idle: the most recently released worker is handed out next.
+        third = _call()
+        await _settle()
+        assert not b.executor.pending
+        a.executor.run_next()
+        assert await third is a.shared
+
+    asyncio.run(scenario())
+    assert len(pool) == 2
+
+
+def test_worker_released_only_after_cancelled_call_finishes(pool, monkeypatch):
+    monkeypatch.setattr(mcp_server.DEFAULTS, "workers", 1)
+
+    async def scenario():
+        first = _call()
+        await _settle()
+        (worker,) = pool
+        first.cancel()
+        await _settle()
+
+        # The handler is still running on the worker thread, so the next call waits.
+        second = _call()
+        await _settle()
+        assert len(worker.executor.pending) == 1
+        assert not second.done()
+
+        worker.executor.run_next()
+        await _settle()
+        assert len(worker.executor.pending) == 1
+        worker.executor.run_next()
+        assert await second is worker.shared
+        assert first.cancelled()
+
+    asyncio.run(scenario())
+    assert len(pool) == 1
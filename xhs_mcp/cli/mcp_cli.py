@@ -5,7 +5,7 @@ from typing import Optional
 
 import typer
 
-from xhs_mcp.mcp_server import configure_defaults, create_server
+from xhs_mcp.mcp_server import configure_defaults, create_server, shutdown
 
 
 app = typer.Typer(help="Run the Xiaohongshu MCP server.")
@@ -31,6 +31,12 @@ def serve(
     chrome_bin: Optional[str] = typer.Option(None, help="Default Chromium/Chrome executable path."),
     debug_dir: Optional[Path] = typer.Option(None, help="Dump DOM/screenshot to this directory for every call."),
     trace: bool = typer.Option(False, help="Capture Playwright tracing when debug_dir is set."),
+    workers: int = typer.Option(
+        2,
+        help="Maximum browser workers serving tool calls concurrently; extra workers start only when "
+        "calls overlap. Each holds one Chromium and runs one call at a time (login tools block "
+        "theirs until login completes or times out).",
+    ),
 ) -> None:
     """Launch the MCP server."""
 
@@ -40,6 +46,7 @@ def serve(
         chrome_bin=chrome_bin,
         debug_dir=str(debug_dir) if debug_dir else None,
         trace=trace or False,
+        workers=workers,
     )
 
     server = create_server()
@@ -47,7 +54,10 @@ def serve(
         server.settings.host = host
         server.settings.port = port
 
-    server.run(transport=transport)
+    try:
+        server.run(transport=transport)
+    finally:
+        shutdown()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import contextlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Iterator
 
 from playwright.sync_api import Browser, BrowserContext, Playwright, sync_playwright
 from .cookies import load_storage_state
@@ -24,11 +25,8 @@ def _stealth_context_args() -> dict:
     }
 
 
-@contextlib.contextmanager
-def launch(playwright: Playwright, chrome_bin: str | None = None) -> Iterator[Browser]:
-    # Prefer Chromium; allow custom executable to reduce detection.
-    chromium = playwright.chromium
-    launch_args = {
+def _launch_args(chrome_bin: str | None) -> dict[str, Any]:
+    launch_args: dict[str, Any] = {
         "headless": True,
         "args": [
             "--disable-blink-features=AutomationControlled",
@@ -43,8 +41,23 @@ def launch(playwright: Playwright, chrome_bin: str | None = None) -> Iterator[Br
     }
     if chrome_bin:
         launch_args["executable_path"] = chrome_bin
+    return launch_args
+
+
+def _context_args(storage_state_path: Path | None) -> dict[str, Any]:
+    ctx_args = _stealth_context_args()
+    if storage_state_path and storage_state_path.exists():
+        # Only inject storage_state if the file contains valid JSON
+        state = load_storage_state(storage_state_path)
+        if state is not None:
+            ctx_args["storage_state"] = state
+    return ctx_args
+
 
-    browser = chromium.launch(**launch_args)
+@contextlib.contextmanager
+def launch(playwright: Playwright, chrome_bin: str | None = None) -> Iterator[Browser]:
+    # Prefer Chromium; allow custom executable to reduce detection.
+    browser = playwright.chromium.launch(**_launch_args(chrome_bin))
     try:
         yield browser
     finally:
@@ -53,13 +66,7 @@ def launch(playwright: Playwright, chrome_bin: str | None = None) -> Iterator[Br
 
 @contextlib.contextmanager
 def new_context(browser: Browser, storage_state_path: Path | None = None) -> Iterator[BrowserContext]:
-    ctx_args = _stealth_context_args()
-    if storage_state_path and storage_state_path.exists():
-        # Only inject storage_state if the file contains valid JSON
-        state = load_storage_state(storage_state_path)
-        if state is not None:
-            ctx_args["storage_state"] = state
-    context = browser.new_context(**ctx_args)
+    context = browser.new_context(**_context_args(storage_state_path))
     try:
         yield context
     finally:
@@ -73,3 +80,80 @@ def pw() -> Iterator[Playwright]:
         yield p
     finally:
         p.stop()
+
+
+def _mtime(path: Path | None) -> float | None:
+    try:
+        return path.stat().st_mtime if path else None
+    except OSError:
+        return None
+
+
+class SharedBrowser:
+    """Playwright driver, browsers and contexts kept alive across calls.
+
+    Sync Playwright objects are bound to the thread that created them, so every
+    method must be called from the same thread.
+    """
+
+    def __init__(self, max_contexts: int = 4) -> None:
+        self._max_contexts = max_contexts
+        self._playwright: Playwright | None = None
+        self._browsers: dict[str | None, Browser] = {}
+        # (chrome_bin, storage_state_path) -> (storage_state mtime, context), oldest first
+        self._contexts: OrderedDict[tuple[str | None, Path | None], tuple[float | None, BrowserContext]] = OrderedDict()
+
+    def context(self, chrome_bin: str | None, storage_state_path: Path | None) -> BrowserContext:
+        """Return a context for these cookies, recreating it when the file changed."""
+        key = (chrome_bin, storage_state_path)
+        mtime = _mtime(storage_state_path)
+        cached = self._contexts.get(key)
+        if cached is not None:
+            cached_mtime, context = cached
+            browser = context.browser
+            if cached_mtime == mtime and browser is not None and browser.is_connected():
+                self._contexts.move_to_end(key)
+                return context
+            del self._contexts[key]
+            _close_quietly(context)
+
+        context = self._browser(chrome_bin).new_context(**_context_args(storage_state_path))
+        self._contexts[key] = (mtime, context)
+        while len(self._contexts) > self._max_contexts:
+            _, (_, oldest) = self._contexts.popitem(last=False)
+            _close_quietly(oldest)
+        return context
+
+    def discard(self, chrome_bin: str | None, storage_state_path: Path | None) -> None:
+        """Close and forget the cached context for these cookies, if any."""
+        cached = self._contexts.pop((chrome_bin, storage_state_path), None)
+        if cached is not None:
+            _close_quietly(cached[1])
+
+    def close(self) -> None:
+        for _, context in self._contexts.values():
+            _close_quietly(context)
+        self._contexts.clear()
+        for browser in self._browsers.values():
+            _close_quietly(browser)
+        self._browsers.clear()
+        playwright, self._playwright = self._playwright, None
+        if playwright is not None:
+            playwright.stop()
+
+    def _browser(self, chrome_bin: str | None) -> Browser:
+        browser = self._browsers.get(chrome_bin)
+        if browser is not None and browser.is_connected():
+            return browser
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        browser = self._playwright.chromium.launch(**_launch_args(chrome_bin))
+        self._browsers[chrome_bin] = browser
+        return browser
+
+
+def _close_quietly(target: Browser | BrowserContext) -> None:
+    try:
+        target.close()
+    except Exception:
+        pass
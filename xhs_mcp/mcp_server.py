@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
 from typing import Any, Callable, Iterable, Sequence, TypeVar
 
-import anyio
 from mcp.server.fastmcp import FastMCP
+from playwright.sync_api import Page
 
 from xhs_mcp.configs import get_chrome_executable, get_cookies_path
-from xhs_mcp.infra.browser import launch, new_context, pw
+from xhs_mcp.infra.browser import SharedBrowser
 from xhs_mcp.infra.cookies import save_storage_state
 from xhs_mcp.xhs.base import ActionContext
 from xhs_mcp.xhs.comment import CommentAction
@@ -25,10 +29,10 @@ from xhs_mcp.xhs.publish import (
 )
 from xhs_mcp.xhs.user_profile import UserProfileAction
 
-from scripts import clean_array
-
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ServerDefaults:
@@ -37,6 +41,27 @@ class ServerDefaults:
     chrome_bin: str | None = None
     debug_dir: Path | None = None
     trace: bool = False
+    workers: int = 2
+
+
+@dataclass
+class _BrowserWorker:
+    """One Playwright thread with its own reusable browser/contexts.
+
+    Sync Playwright objects are thread-bound, so each worker owns a single-thread
+    executor and its SharedBrowser is only touched from that thread.
+    """
+
+    executor: ThreadPoolExecutor
+    shared: SharedBrowser
+
+
+_WORKERS: list[_BrowserWorker] = []
+_IDLE_WORKERS: asyncio.LifoQueue[_BrowserWorker] | None = None
+
+# Debug artifacts are captured on the Playwright thread but written to disk here,
+# so the tool result is returned without waiting on file I/O.
+_ARTIFACT_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-artifacts")
 
 
 DEFAULTS = ServerDefaults()
@@ -49,8 +74,14 @@ def configure_defaults(
     chrome_bin: str | None = None,
     debug_dir: str | Path | None = None,
     trace: bool | None = None,
+    workers: int | None = None,
 ) -> None:
-    """Allow CLI to set fallback values for tool parameters."""
+    """Allow CLI to set fallback values for tool parameters.
+
+    ``workers`` caps the pool; workers are only started when calls overlap. Each
+    worker runs one tool call at a time, and the login tools hold theirs for up to
+    ``timeout`` seconds.
+    """
 
     if profile is not None:
         DEFAULTS.profile = profile
@@ -59,27 +90,20 @@ def configure_defaults(
     if chrome_bin is not None:
         DEFAULTS.chrome_bin = chrome_bin
     if debug_dir is not None:
+        # Resolve once here so tool calls without debug_dir never touch the filesystem.
         DEFAULTS.debug_dir = _normalize_debug_dir(debug_dir)
     if trace is not None:
         DEFAULTS.trace = trace
+    if workers is not None:
+        DEFAULTS.workers = max(1, workers)
 
 
 def _normalize_debug_dir(value: str | Path | None) -> Path | None:
     if value is None:
         return None
-    if isinstance(value, Path):
-        return value
     return Path(value).expanduser().resolve()
 
 
-def _resolve_bool(value: bool | None, default: bool) -> bool:
-    return default if value is None else bool(value)
-
-
-def _effective_str(provided: str | None, fallback: str | None) -> str | None:
-    return provided if provided is not None else fallback
-
-
 def _resolve_invocation_args(
     profile: str | None,
     cookies_path: str | None,
@@ -87,16 +111,17 @@ def _resolve_invocation_args(
     debug_dir: str | None,
     trace: bool | None,
 ) -> tuple[str | None, str | None, str | None, Path | None, bool]:
-    profile_eff = _effective_str(profile, DEFAULTS.profile)
-    cookies_eff = _effective_str(cookies_path, DEFAULTS.cookies_path)
-    chrome_eff = _effective_str(chrome_bin, DEFAULTS.chrome_bin)
+    profile_eff = profile if profile is not None else DEFAULTS.profile
+    cookies_eff = cookies_path if cookies_path is not None else DEFAULTS.cookies_path
+    chrome_eff = chrome_bin if chrome_bin is not None else DEFAULTS.chrome_bin
     debug_eff = _normalize_debug_dir(debug_dir) if debug_dir is not None else DEFAULTS.debug_dir
-    trace_eff = _resolve_bool(trace, DEFAULTS.trace)
+    trace_eff = DEFAULTS.trace if trace is None else bool(trace)
     return profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff
 
 
 def _run_with_page_sync(
     *,
+    shared: SharedBrowser,
     profile: str | None,
     cookies_path: str | None,
     chrome_bin: str | None,
@@ -108,37 +133,74 @@ def _run_with_page_sync(
     chrome_exe = get_chrome_executable(chrome_bin)
 
     debug_dir_path = debug_dir
-    console_logs: list[str] = []
-
-    with pw() as playwright:
-        with launch(playwright, chrome_bin=chrome_exe) as browser:
-            with new_context(browser, cookies_file) as context:
-                if trace and debug_dir_path:
-                    context.tracing.start(screenshots=True, snapshots=True, sources=True)
-
-                page = context.new_page()
-
-                if debug_dir_path is not None:
-                    page.on("console", lambda msg: console_logs.append(f"[{msg.type}] {msg.text}"))
-
-                try:
-                    return handler(ActionContext(page), cookies_file)
-                finally:
-                    if debug_dir_path is not None:
-                        debug_dir_path.mkdir(parents=True, exist_ok=True)
-                        (debug_dir_path / "dom.html").write_text(page.content(), encoding="utf-8")
-
-                        screenshot_path = debug_dir_path / "page.png"
-                        try:
-                            page.screenshot(path=str(screenshot_path), full_page=True)
-                        except Exception as exc:
-                            (debug_dir_path / "screenshot-error.log").write_text(str(exc), encoding="utf-8")
-
-                        (debug_dir_path / "console.log").write_text("\n".join(console_logs), encoding="utf-8")
-
-                    if trace and debug_dir_path:
-                        trace_path = debug_dir_path / "trace.zip"
-                        context.tracing.stop(path=str(trace_path))
+    tracing = bool(trace and debug_dir_path)
+
+    context = shared.context(chrome_exe, cookies_file)
+
+    page = None
+    console_logs: list[str] | None = None
+    tracing_started = False
+    failed = True
+    try:
+        try:
+            if tracing:
+                context.tracing.start(screenshots=True, snapshots=True, sources=True)
+                tracing_started = True
+
+            page = context.new_page()
+
+            if debug_dir_path is not None:
+                logs: list[str] = []
+                console_logs = logs
+                page.on("console", lambda msg: logs.append(f"[{msg.type}] {msg.text}"))
+
+            try:
+                result = handler(ActionContext(page), cookies_file)
+            finally:
+                if debug_dir_path is not None and console_logs is not None:
+                    _capture_debug_artifacts(page, debug_dir_path, console_logs)
+        finally:
+            if tracing_started:
+                context.tracing.stop(path=str(debug_dir_path / "trace.zip"))
+        failed = False
+        return result
+    finally:
+        if failed:
+            # The context is cached across calls; don't reuse one left in an unknown state.
+            shared.discard(chrome_exe, cookies_file)
+        elif page is not None:
+            page.close()
+
+
+def _capture_debug_artifacts(page: Page, debug_dir: Path, console_logs: list[str]) -> None:
+    """Grab DOM/screenshot/console on the Playwright thread; disk writes happen in the background."""
+
+    debug_dir.mkdir(parents=True, exist_ok=True)
+    files: dict[str, bytes] = {}
+    try:
+        files["dom.html"] = page.content().encode("utf-8", "replace")
+    except Exception as exc:
+        files["dom-error.log"] = str(exc).encode("utf-8", "replace")
+    try:
+        files["page.png"] = page.screenshot(full_page=True)
+    except Exception as exc:
+        files["screenshot-error.log"] = str(exc).encode("utf-8", "replace")
+    files["console.log"] = "\n".join(console_logs).encode("utf-8", "replace")
+    future = _ARTIFACT_WRITER.submit(_write_debug_artifacts, debug_dir, files)
+    future.add_done_callback(_log_artifact_error)
+
+
+def _log_artifact_error(future: Future[None]) -> None:
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("failed to write debug artifacts", exc_info=exc)
+
+
+def _write_debug_artifacts(debug_dir: Path, files: dict[str, bytes]) -> None:
+    for name, data in files.items():
+        (debug_dir / name).write_bytes(data)
 
 
 async def _run_with_page(
@@ -150,22 +212,83 @@ async def _run_with_page(
     trace: bool,
     handler: Callable[[ActionContext, Path], T],
 ) -> T:
-    return await anyio.to_thread.run_sync(
-        partial(
-            _run_with_page_sync,
-            profile=profile,
-            cookies_path=cookies_path,
-            chrome_bin=chrome_bin,
-            debug_dir=debug_dir,
-            trace=trace,
-            handler=handler,
-        )
+    worker = await _acquire_worker()
+    loop = asyncio.get_running_loop()
+    future = worker.executor.submit(
+        _run_with_page_sync,
+        shared=worker.shared,
+        profile=profile,
+        cookies_path=cookies_path,
+        chrome_bin=chrome_bin,
+        debug_dir=debug_dir,
+        trace=trace,
+        handler=handler,
     )
+    # Release only once the thread is actually free: if the awaiting task is
+    # cancelled the handler keeps running, and the worker must stay busy until then.
+    future.add_done_callback(lambda _: _release_worker_threadsafe(loop, worker))
+    return await asyncio.wrap_future(future)
+
+
+async def _acquire_worker() -> _BrowserWorker:
+    global _IDLE_WORKERS
+
+    if _IDLE_WORKERS is None:
+        # LIFO so sequential calls keep hitting the most recently used (warm) browser.
+        _IDLE_WORKERS = asyncio.LifoQueue()
+    # Only start another Chromium when every existing worker is busy.
+    if _IDLE_WORKERS.empty() and len(_WORKERS) < DEFAULTS.workers:
+        worker = _BrowserWorker(
+            executor=ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"playwright-{len(_WORKERS)}"),
+            shared=SharedBrowser(max_contexts=4),
+        )
+        _WORKERS.append(worker)
+        return worker
+    return await _IDLE_WORKERS.get()
+
+
+def _release_worker_threadsafe(loop: asyncio.AbstractEventLoop, worker: _BrowserWorker) -> None:
+    try:
+        loop.call_soon_threadsafe(_release_worker, worker)
+    except RuntimeError:
+        pass  # event loop already closed; the pool is going away with it
+
+
+def _release_worker(worker: _BrowserWorker) -> None:
+    if worker in _WORKERS and _IDLE_WORKERS is not None:
+        _IDLE_WORKERS.put_nowait(worker)
+
+
+def shutdown() -> None:
+    """Close the shared browsers and stop the Playwright worker threads.
+
+    Safe to call more than once; the next tool call starts a fresh pool.
+    """
+
+    global _IDLE_WORKERS, _ARTIFACT_WRITER
+
+    workers = list(_WORKERS)
+    _WORKERS.clear()
+    _IDLE_WORKERS = None
+    for worker in workers:
+        try:
+            worker.executor.submit(worker.shared.close).result()
+        except Exception:
+            logger.exception("failed to close browser worker")
+        worker.executor.shutdown(wait=True)
+    _ARTIFACT_WRITER.shutdown(wait=True)
+    _ARTIFACT_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-artifacts")
 
 
 mcp = FastMCP("Xiaohongshu")
 
 
+def _handle_feeds_list(ctx: ActionContext, _cookies: Path) -> list[dict[str, Any]]:
+    action = FeedsListAction(ctx)
+    feeds: list[Feed] = action.get_feeds()
+    return [feed.raw for feed in feeds]
+
+
 @mcp.tool()
 async def feeds_list(
     profile: str | None = None,
@@ -180,21 +303,22 @@ async def feeds_list(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> list[dict[str, Any]]:
-        action = FeedsListAction(ctx)
-        feeds: list[Feed] = action.get_feeds()
-        return clean_array.clean_xsec_tokens([feed.raw for feed in feeds])
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=_handle_feeds_list,
     )
 
 
+def _handle_search_feeds(ctx: ActionContext, _cookies: Path, *, keyword: str) -> list[dict[str, Any]]:
+    action = SearchAction(ctx)
+    feeds = action.search(keyword)
+    return [feed.raw for feed in feeds]
+
+
 @mcp.tool()
 async def search_feeds(
     keyword: str,
@@ -210,21 +334,28 @@ async def search_feeds(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> list[dict[str, Any]]:
-        action = SearchAction(ctx)
-        feeds = action.search(keyword)
-        return clean_array.clean_xsec_tokens([feed.raw for feed in feeds])
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(_handle_search_feeds, keyword=keyword),
     )
 
 
+def _handle_feed_detail(
+    ctx: ActionContext,
+    _cookies: Path,
+    *,
+    feed_id: str,
+    xsec_token: str,
+) -> dict[str, Any]:
+    action = FeedDetailAction(ctx)
+    detail = action.get_detail(feed_id, xsec_token)
+    return {"note": detail.data, "comments": detail.comments}
+
+
 @mcp.tool()
 async def feed_detail(
     feed_id: str,
@@ -241,25 +372,38 @@ async def feed_detail(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, Any]:
-        action = FeedDetailAction(ctx)
-        detail = action.get_detail(feed_id, xsec_token)
-        return {"note": detail.data, "comments": detail.comments}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(_handle_feed_detail, feed_id=feed_id, xsec_token=xsec_token),
     )
 
 
-def _normalize_tags(tags: Iterable[str] | None) -> list[str]:
-    if not tags:
-        return []
-    return [tag.lstrip("#") for tag in tags if tag]
+def _normalize_tags(tags: Iterable[str] | None) -> tuple[str, ...]:
+    return tuple(tag.lstrip("#") for tag in tags if tag) if tags else ()
+
+
+def _handle_publish_image(
+    ctx: ActionContext,
+    _cookies: Path,
+    *,
+    title: str,
+    content: str,
+    image_paths: Sequence[str],
+    tags: Sequence[str] | None,
+) -> dict[str, str]:
+    action = PublishImageAction(ctx)
+    payload = PublishImageContent(
+        title=title,
+        content=content,
+        image_paths=[os.path.expanduser(path) for path in image_paths],
+        tags=_normalize_tags(tags),
+    )
+    action.publish(payload)
+    return {"status": "submitted"}
 
 
 @mcp.tool()
@@ -283,28 +427,40 @@ async def publish_image(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    normalized_tags = _normalize_tags(tags)
-    normalized_images = [str(Path(path).expanduser()) for path in image_paths]
-
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, str]:
-        action = PublishImageAction(ctx)
-        payload = PublishImageContent(
-            title=title,
-            content=content,
-            image_paths=normalized_images,
-            tags=normalized_tags,
-        )
-        action.publish(payload)
-        return {"status": "submitted"}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(
+            _handle_publish_image,
+            title=title,
+            content=content,
+            image_paths=image_paths,
+            tags=tags,
+        ),
+    )
+
+
+def _handle_publish_video(
+    ctx: ActionContext,
+    _cookies: Path,
+    *,
+    title: str,
+    content: str,
+    video_path: str,
+    tags: Sequence[str] | None,
+) -> dict[str, str]:
+    action = PublishVideoAction(ctx)
+    payload = PublishVideoContent(
+        title=title,
+        content=content,
+        video_path=os.path.expanduser(video_path),
+        tags=_normalize_tags(tags),
     )
+    action.publish(payload)
+    return {"status": "submitted"}
 
 
 @mcp.tool()
@@ -325,30 +481,35 @@ async def publish_video(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    normalized_tags = _normalize_tags(tags)
-    normalized_video = str(Path(video_path).expanduser())
-
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, str]:
-        action = PublishVideoAction(ctx)
-        payload = PublishVideoContent(
-            title=title,
-            content=content,
-            video_path=normalized_video,
-            tags=normalized_tags,
-        )
-        action.publish(payload)
-        return {"status": "submitted"}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(
+            _handle_publish_video,
+            title=title,
+            content=content,
+            video_path=video_path,
+            tags=tags,
+        ),
     )
 
 
+def _handle_post_comment(
+    ctx: ActionContext,
+    _cookies: Path,
+    *,
+    feed_id: str,
+    xsec_token: str,
+    content: str,
+) -> dict[str, str]:
+    action = CommentAction(ctx)
+    action.post_comment(feed_id, xsec_token, content)
+    return {"status": "submitted"}
+
+
 @mcp.tool()
 async def post_comment(
     feed_id: str,
@@ -366,40 +527,29 @@ async def post_comment(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, str]:
-        action = CommentAction(ctx)
-        action.post_comment(feed_id, xsec_token, content)
-        return {"status": "submitted"}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(_handle_post_comment, feed_id=feed_id, xsec_token=xsec_token, content=content),
     )
 
 
 async def _interact_common(
     *,
-    feed_id: str,
-    xsec_token: str,
     profile: str | None,
     cookies_path: str | None,
     chrome_bin: str | None,
     debug_dir: str | None,
     trace: bool | None,
-    executor: Callable[[ActionContext], None],
+    handler: Callable[[ActionContext, Path], dict[str, str]],
 ) -> dict[str, str]:
     profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = _resolve_invocation_args(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, str]:
-        executor(ctx)
-        return {"status": "submitted"}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
@@ -410,6 +560,26 @@ async def _interact_common(
     )
 
 
+def _handle_like(ctx: ActionContext, _cookies: Path, *, feed_id: str, xsec_token: str) -> dict[str, str]:
+    LikeAction(ctx).like(feed_id, xsec_token)
+    return {"status": "submitted"}
+
+
+def _handle_unlike(ctx: ActionContext, _cookies: Path, *, feed_id: str, xsec_token: str) -> dict[str, str]:
+    LikeAction(ctx).unlike(feed_id, xsec_token)
+    return {"status": "submitted"}
+
+
+def _handle_favorite(ctx: ActionContext, _cookies: Path, *, feed_id: str, xsec_token: str) -> dict[str, str]:
+    FavoriteAction(ctx).favorite(feed_id, xsec_token)
+    return {"status": "submitted"}
+
+
+def _handle_unfavorite(ctx: ActionContext, _cookies: Path, *, feed_id: str, xsec_token: str) -> dict[str, str]:
+    FavoriteAction(ctx).unfavorite(feed_id, xsec_token)
+    return {"status": "submitted"}
+
+
 @mcp.tool()
 async def like_feed(
     feed_id: str,
@@ -423,14 +593,12 @@ async def like_feed(
     """Like a feed."""
 
     return await _interact_common(
-        feed_id=feed_id,
-        xsec_token=xsec_token,
         profile=profile,
         cookies_path=cookies_path,
         chrome_bin=chrome_bin,
         debug_dir=debug_dir,
         trace=trace,
-        executor=lambda ctx: LikeAction(ctx).like(feed_id, xsec_token),
+        handler=partial(_handle_like, feed_id=feed_id, xsec_token=xsec_token),
     )
 
 
@@ -447,14 +615,12 @@ async def unlike_feed(
     """Cancel a like."""
 
     return await _interact_common(
-        feed_id=feed_id,
-        xsec_token=xsec_token,
         profile=profile,
         cookies_path=cookies_path,
         chrome_bin=chrome_bin,
         debug_dir=debug_dir,
         trace=trace,
-        executor=lambda ctx: LikeAction(ctx).unlike(feed_id, xsec_token),
+        handler=partial(_handle_unlike, feed_id=feed_id, xsec_token=xsec_token),
     )
 
 
@@ -471,14 +637,12 @@ async def favorite_feed(
     """Collect a feed."""
 
     return await _interact_common(
-        feed_id=feed_id,
-        xsec_token=xsec_token,
         profile=profile,
         cookies_path=cookies_path,
         chrome_bin=chrome_bin,
         debug_dir=debug_dir,
         trace=trace,
-        executor=lambda ctx: FavoriteAction(ctx).favorite(feed_id, xsec_token),
+        handler=partial(_handle_favorite, feed_id=feed_id, xsec_token=xsec_token),
     )
 
 
@@ -495,17 +659,31 @@ async def unfavorite_feed(
     """Cancel a collect."""
 
     return await _interact_common(
-        feed_id=feed_id,
-        xsec_token=xsec_token,
         profile=profile,
         cookies_path=cookies_path,
         chrome_bin=chrome_bin,
         debug_dir=debug_dir,
         trace=trace,
-        executor=lambda ctx: FavoriteAction(ctx).unfavorite(feed_id, xsec_token),
+        handler=partial(_handle_unfavorite, feed_id=feed_id, xsec_token=xsec_token),
     )
 
 
+def _handle_user_profile(
+    ctx: ActionContext,
+    _cookies: Path,
+    *,
+    user_id: str,
+    xsec_token: str,
+) -> dict[str, Any]:
+    action = UserProfileAction(ctx)
+    profile_data = action.user_profile(user_id, xsec_token)
+    return {
+        "basic_info": profile_data.basic_info,
+        "interactions": profile_data.interactions,
+        "feeds": profile_data.feeds,
+    }
+
+
 @mcp.tool()
 async def user_profile(
     user_id: str,
@@ -522,25 +700,26 @@ async def user_profile(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, Any]:
-        action = UserProfileAction(ctx)
-        profile_data = action.user_profile(user_id, xsec_token)
-        return {
-            "basic_info": profile_data.basic_info,
-            "interactions": profile_data.interactions,
-            "feeds": profile_data.feeds,
-        }
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(_handle_user_profile, user_id=user_id, xsec_token=xsec_token),
     )
 
 
+def _handle_my_profile(ctx: ActionContext, _cookies: Path) -> dict[str, Any]:
+    action = UserProfileAction(ctx)
+    profile_data = action.get_my_profile_via_sidebar()
+    return {
+        "basic_info": profile_data.basic_info,
+        "interactions": profile_data.interactions,
+        "feeds": profile_data.feeds,
+    }
+
+
 @mcp.tool()
 async def my_profile(
     profile: str | None = None,
@@ -555,25 +734,21 @@ async def my_profile(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, Any]:
-        action = UserProfileAction(ctx)
-        profile_data = action.get_my_profile_via_sidebar()
-        return {
-            "basic_info": profile_data.basic_info,
-            "interactions": profile_data.interactions,
-            "feeds": profile_data.feeds,
-        }
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=_handle_my_profile,
     )
 
 
+def _handle_check_login(ctx: ActionContext, _cookies: Path) -> dict[str, bool]:
+    logged = check_login_status(ctx.page)
+    return {"logged_in": logged}
+
+
 @mcp.tool()
 async def check_login(
     profile: str | None = None,
@@ -588,18 +763,32 @@ async def check_login(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, bool]:
-        logged = check_login_status(ctx.page)
-        return {"logged_in": logged}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=_handle_check_login,
+    )
+
+
+def _handle_get_login_qrcode(
+    ctx: ActionContext,
+    _cookies: Path,
+    *,
+    timeout: int,
+    poll_interval: float,
+    reload_interval: float,
+) -> dict[str, Any]:
+    src, logged = fetch_qrcode_image(
+        ctx.page,
+        timeout_seconds=timeout,
+        poll_interval=poll_interval,
+        reload_interval=reload_interval,
+        verbose=False,
     )
+    return {"logged_in": logged, "qrcode": src}
 
 
 @mcp.tool()
@@ -619,26 +808,41 @@ async def get_login_qrcode(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, Any]:
-        src, logged = fetch_qrcode_image(
-            ctx.page,
-            timeout_seconds=timeout,
-            poll_interval=poll_interval,
-            reload_interval=reload_interval,
-            verbose=False,
-        )
-        return {"logged_in": logged, "qrcode": src}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(
+            _handle_get_login_qrcode,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            reload_interval=reload_interval,
+        ),
     )
 
 
+def _handle_wait_for_login_complete(
+    ctx: ActionContext,
+    cookies_file: Path,
+    *,
+    timeout: int,
+    poll_interval: float,
+) -> dict[str, Any]:
+    success = wait_for_login(
+        ctx.page,
+        timeout_seconds=timeout,
+        poll_interval=poll_interval,
+        verbose=False,
+    )
+    if not success:
+        raise RuntimeError("Login timed out.")
+    state = ctx.page.context.storage_state()
+    save_storage_state(cookies_file, state)
+    return {"status": "logged_in", "cookies_path": str(cookies_file)}
+
+
 @mcp.tool()
 async def wait_for_login_complete(
     timeout: int = 240,
@@ -655,26 +859,13 @@ async def wait_for_login_complete(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, cookies_file: Path) -> dict[str, Any]:
-        success = wait_for_login(
-            ctx.page,
-            timeout_seconds=timeout,
-            poll_interval=poll_interval,
-            verbose=False,
-        )
-        if not success:
-            raise RuntimeError("Login timed out.")
-        state = ctx.page.context.storage_state()
-        save_storage_state(cookies_file, state)
-        return {"status": "logged_in", "cookies_path": str(cookies_file)}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(_handle_wait_for_login_complete, timeout=timeout, poll_interval=poll_interval),
     )
 
 
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page, Response, TimeoutError as PlaywrightTimeoutError
 
 from .base import PlaywrightAction
 
 
+EDITOR_TRIGGER_SELECTOR = "div.input-box div.content-edit span"
+EDITOR_SELECTOR = "div.input-box div.content-edit p.content-input"
+SUBMIT_SELECTOR = "div.bottom button.submit"
+COMMENT_POST_PATH = "/api/sns/web/v1/comment/post"
+
+
+def _is_comment_post(response: Response) -> bool:
+    return response.request.method == "POST" and COMMENT_POST_PATH in response.url
+
+
 class CommentAction(PlaywrightAction):
     def post_comment(self, feed_id: str, xsec_token: str, content: str) -> None:
         page: Page = self.page
@@ -12,15 +22,33 @@ class CommentAction(PlaywrightAction):
         page.goto(url,wait_until="domcontentloaded")
 
         print("进入目标页面")
-        page.wait_for_timeout(3_000)  # 停留 3 秒
-
-        # page.wait_for_load_state("networkidle")
 
-        page.locator("div.input-box div.content-edit span").first.click()
-        editor = page.locator("div.input-box div.content-edit p.content-input").first
+        # _locate_editor 等待输入框可见，作为页面就绪信号
+        editor = self._locate_editor(page)
         editor.fill(content)
 
-        submit = page.locator("div.bottom button.submit").first
-        submit.click()
-        page.wait_for_timeout(1_000)
-
+        submit = self._locate_submit(page)
+        # 以评论接口的响应作为提交完成的信号，避免页面关闭时请求被中断
+        try:
+            with page.expect_response(_is_comment_post, timeout=30_000) as response_info:
+                submit.click()
+        except PlaywrightTimeoutError as exc:
+            raise RuntimeError("comment request was not sent") from exc
+        response = response_info.value
+        if not response.ok:
+            raise RuntimeError(f"comment request failed: HTTP {response.status}")
+
+    def _locate_editor(self, page: Page) -> Locator:
+        # 点击占位 span 激活输入框，再等待真正的编辑区域出现
+        trigger = page.locator(EDITOR_TRIGGER_SELECTOR).first
+        trigger.wait_for(state="visible", timeout=30_000)
+        trigger.click()
+
+        editor = page.locator(EDITOR_SELECTOR).first
+        editor.wait_for(state="visible", timeout=30_000)
+        return editor
+
+    def _locate_submit(self, page: Page) -> Locator:
+        submit = page.locator(SUBMIT_SELECTOR).first
+        submit.wait_for(state="visible", timeout=30_000)
+        return submit
@@ -10,12 +10,27 @@ from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from .base import ActionContext, PlaywrightAction
 
+# Read-only sentinel for chained .get() when noteCard is missing; never mutate.
+_EMPTY: Dict[str, Any] = {}
+
 
 @dataclass(slots=True)
 class Feed:
     raw: Dict[str, Any]
 
 
+def _parse_feeds(payload: str) -> List[Feed]:
+    feeds: List[Feed] = []
+    for item in json.loads(payload):
+        # Drop the duplicated noteCard.user.xsecToken; the top-level xsecToken is kept.
+        if type(item) is dict and item.get("modelType") == "note":
+            user = item.get("noteCard", _EMPTY).get("user")
+            if user is not None:
+                user.pop("xsecToken", None)
+        feeds.append(Feed(raw=item))
+    return feeds
+
+
 class FeedsListAction(PlaywrightAction):
     def __init__(self, ctx: ActionContext) -> None:
         super().__init__(ctx)
@@ -46,8 +61,7 @@ class FeedsListAction(PlaywrightAction):
         )
         if not payload:
             raise ValueError("no feeds found in __INITIAL_STATE__")
-        data = json.loads(payload)
-        return [Feed(raw=item) for item in data]
+        return _parse_feeds(payload)
 
 
 class SearchAction(PlaywrightAction):
@@ -73,5 +87,4 @@ class SearchAction(PlaywrightAction):
         )
         if not payload:
             raise ValueError("no search feeds found in __INITIAL_STATE__")
-        data = json.loads(payload)
-        return [Feed(raw=item) for item in data]
+        return _parse_feeds(payload)
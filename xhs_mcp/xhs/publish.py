@@ -3,7 +3,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Sequence
 
 from playwright.sync_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
 
@@ -18,7 +18,7 @@ class PublishImageContent:
     title: str
     content: str
     image_paths: List[str] = field(default_factory=list)
-    tags: List[str] = field(default_factory=list)
+    tags: Sequence[str] = ()
 
 
 @dataclass(slots=True)
@@ -26,7 +26,7 @@ class PublishVideoContent:
     title: str
     content: str
     video_path: str
-    tags: List[str] = field(default_factory=list)
+    tags: Sequence[str] = ()
 
 
 class _PublishBase(PlaywrightAction):